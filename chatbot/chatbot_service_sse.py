@@ -9,20 +9,132 @@ from flask_cors import CORS
 import sys
 import os
 import json
+import re
 import time
 import threading
 import queue
+from concurrent.futures import Future
+
+try:
+    import orjson  # 3-10x faster than stdlib json, emits bytes directly
+except ImportError:
+    orjson = None
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from main import RAGChatbot
+from retrieval.retriever import Retriever
 
 app = Flask(__name__)
 CORS(app)
 
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+
+def sse_event(payload):
+    """Serialize a payload dict into an SSE data frame (bytes)."""
+    if orjson is not None:
+        return b"data: " + orjson.dumps(payload) + b"\n\n"
+    return ("data: " + json.dumps(payload) + "\n\n").encode('utf-8')
+
 chatbot = None
 is_warmed_up = False
 
 
+class QueryBatcher:
+    """
+    Coalesces concurrent retrieval calls into batched Qdrant searches.
+
+    Requests submit their query together with a future and wait; a
+    background worker collects whatever arrives within a short window
+    (up to a batch cap) and serves the whole batch with a single
+    embedder forward pass and one batched Qdrant call via
+    Retriever.retrieve_many, then fans results back through the futures.
+    """
+
+    MAX_BATCH_SIZE = 32
+    MAX_WAIT_MS = 5
+
+    def __init__(self, retriever):
+        """
+        Initialize the batcher and start its worker thread.
+
+        Args:
+            retriever: Retriever instance to serve batches with
+        """
+        self.retriever = retriever
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def retrieve(self, query, top_k=None, filter_by=None):
+        """
+        Retrieve documents for a query, batching with concurrent callers.
+
+        Non-default arguments bypass batching since they cannot share a
+        batched call. Signature matches Retriever.retrieve so this can
+        stand in for it transparently.
+
+        Args:
+            query: User query text
+            top_k: Number of results to retrieve (bypasses batching)
+            filter_by: Optional metadata filters (bypasses batching)
+
+        Returns:
+            List of retrieved documents with metadata and scores
+        """
+        if top_k is not None or filter_by:
+            return Retriever.retrieve(self.retriever, query, top_k=top_k, filter_by=filter_by)
+
+        future = Future()
+        self._queue.put((query, future))
+        try:
+            return future.result()
+        except Exception as e:
+            # Match Retriever.retrieve's contract: swallow errors and
+            # return no documents rather than propagating to graph nodes
+            print(f"Error in batched retrieval: {e}", file=sys.stderr)
+            return []
+
+    def _run(self):
+        """Worker loop: drain the queue into batches and serve them."""
+        while True:
+            # Block for the first request, then collect stragglers
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.MAX_WAIT_MS / 1000.0
+
+            while len(batch) < self.MAX_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            queries = [query for query, _ in batch]
+            try:
+                results = self.retriever.retrieve_many(queries)
+                for (_, future), docs in zip(batch, results):
+                    future.set_result(docs)
+            except Exception as e:
+                print(f"Error in query batcher: {e}", file=sys.stderr)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+
 def pre_warm_pipeline(bot):
     """Pre-warm the RAG pipeline at startup to eliminate cold-start latency."""
     global is_warmed_up
@@ -37,6 +149,21 @@ def pre_warm_pipeline(bot):
         dummy_text = "This is a warm-up query to load the embedding model"
         bot.retriever.embedding_generator.generate_embedding(dummy_text)
         print("  ✓ Sentence transformer loaded", file=sys.stderr)
+
+        print("  → Warming embedder across production input lengths...", file=sys.stderr)
+        # Encode a range of realistic sequence lengths so kernels and
+        # shape caches are materialized before the first real query,
+        # not during it
+        bot.retriever.embedding_generator.generate_embeddings(
+            ["x " * n for n in (8, 32, 64, 128)]
+        )
+        print("  ✓ Embedder warmed for all length buckets", file=sys.stderr)
+
+        print("  → Compiling similarity kernels...", file=sys.stderr)
+        # Pay the numba JIT compile cost at startup, not on the first query
+        from retrieval import _kernels
+        _kernels.warmup()
+        print("  ✓ Similarity kernels ready", file=sys.stderr)
         
         print("  → Warming up Qdrant connection...", file=sys.stderr)
         # Try a simple retrieve to warm up the connection
@@ -61,107 +188,90 @@ def initialize_chatbot():
     if chatbot is None:
         print("Initializing chatbot service...", file=sys.stderr)
         chatbot = RAGChatbot()
+        # Route retrieval through the micro-batcher so concurrent
+        # requests share embedder forward passes and Qdrant calls
+        batcher = QueryBatcher(chatbot.retriever)
+        chatbot.retriever.retrieve = batcher.retrieve
         print("Chatbot service ready!", file=sys.stderr)
         pre_warm_pipeline(chatbot)
     return chatbot
 
+# Sentence boundary: split after ./!/? followed by whitespace
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
 def chunk_text(text, chunk_size=30):
     """Split text into semantic chunks for streaming."""
     if not text:
         return
-    
-    sentences = text.replace('? ', '?|').replace('! ', '!|').replace('. ', '.|').split('|')
-    current_chunk = ""
-    
+
+    sentences = _SENT_RE.split(text)
+
+    # Aggregate sentences in a list buffer with a running length so
+    # emitting a chunk is one join instead of repeated str concatenation
+    buf = []
+    buf_len = 0
+
     for sentence in sentences:
         sentence = sentence.strip()
         if not sentence:
             continue
-        
-        if current_chunk and len(current_chunk) + len(sentence) > chunk_size:
-            yield current_chunk
-            current_chunk = sentence + " "
-        else:
-            current_chunk += sentence + " "
-    
-    if current_chunk.strip():
-        yield current_chunk.strip()
+
+        if buf and buf_len + len(sentence) > chunk_size:
+            yield "".join(buf)
+            buf.clear()
+            buf_len = 0
+
+        buf.append(sentence)
+        buf.append(" ")
+        buf_len += len(sentence) + 1
+
+    if buf:
+        yield "".join(buf).strip()
 
 
 def generate_sse_response(query_text, user_id, session_id):
-    """Generator function for SSE streaming with keepalive."""
-    result_queue = queue.Queue()
-    error_occurred = threading.Event()
-    
-    def query_worker():
-        """Worker thread to execute the query."""
+    """Generator function for SSE streaming of LLM token deltas."""
+    try:
+        # Send start event immediately
+        yield sse_event({'type': 'start'})
+
+        bot = initialize_chatbot()
+        emitted = False
+
         try:
-            bot = initialize_chatbot()
-            full_response = bot.query(query_text, user_id, session_id)
-            result_queue.put(('success', full_response))
+            # Stream deltas straight from the LLM - no buffering, no
+            # artificial chunking delay
+            for delta in bot.query_stream(query_text, user_id, session_id):
+                if delta:
+                    emitted = True
+                    yield sse_event({'type': 'chunk', 'content': delta})
         except Exception as e:
-            print(f"Error in query worker: {e}", file=sys.stderr)
+            print(f"Error in streaming query, falling back to buffered: {e}", file=sys.stderr)
             import traceback
             traceback.print_exc()
-            result_queue.put(('error', str(e)))
-            error_occurred.set()
-    
-    try:
-        # Send start event immediately
-        yield f"data: {json.dumps({'type': 'start'})}\n\n"
-        
-        # Start query in background thread
-        worker = threading.Thread(target=query_worker, daemon=True)
-        worker.start()
-        
-        # Send keepalive messages while waiting for response
-        keepalive_count = 0
-        while worker.is_alive():
-            try:
-                # Check if result is ready (non-blocking with timeout)
-                status, result = result_queue.get(timeout=2.0)
-                
-                if status == 'error':
-                    yield f"data: {json.dumps({'type': 'error', 'error': result})}\n\n"
-                    return
-                elif status == 'success':
-                    # Stream the response in chunks
-                    if result and result.strip():
-                        for chunk in chunk_text(result, chunk_size=30):
-                            yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
-                            time.sleep(0.01)
-                    else:
-                        yield f"data: {json.dumps({'type': 'chunk', 'content': 'I apologize, but I could not generate a response. Please try rephrasing your question.'})}\n\n"
-                    
-                    yield f"data: {json.dumps({'type': 'done'})}\n\n"
-                    return
-                    
-            except queue.Empty:
-                # Still processing - send keepalive
-                keepalive_count += 1
-                if keepalive_count <= 15:  # Max 30 seconds of keepalives
-                    yield f"data: {json.dumps({'type': 'keepalive'})}\n\n"
-                else:
-                    # Timeout after 30 seconds
-                    yield f"data: {json.dumps({'type': 'error', 'error': 'Request timeout - please try again'})}\n\n"
-                    return
-        
-        # Worker finished - get final result
-        if not result_queue.empty():
-            status, result = result_queue.get_nowait()
-            if status == 'success' and result:
-                for chunk in chunk_text(result, chunk_size=30):
-                    yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
-                    time.sleep(0.01)
-                yield f"data: {json.dumps({'type': 'done'})}\n\n"
-            elif status == 'error':
-                yield f"data: {json.dumps({'type': 'error', 'error': result})}\n\n"
-        
+
+            if not emitted:
+                # Fall back to the blocking query, chunked for the client
+                result = bot.query(query_text, user_id, session_id)
+                if result and result.strip():
+                    for chunk in chunk_text(result, chunk_size=30):
+                        emitted = True
+                        yield sse_event({'type': 'chunk', 'content': chunk})
+            else:
+                yield sse_event({'type': 'error', 'error': str(e)})
+                return
+
+        if not emitted:
+            yield sse_event({'type': 'chunk', 'content': 'I apologize, but I could not generate a response. Please try rephrasing your question.'})
+
+        yield sse_event({'type': 'done'})
+
     except Exception as e:
         print(f"Error in SSE generator: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc()
-        yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
+        yield sse_event({'type': 'error', 'error': str(e)})
 
 @app.route('/health', methods=['GET'])
 def health():
@@ -323,9 +433,73 @@ def after_request(response):
         response.headers['X-Accel-Buffering'] = 'no'
     return response
 
-if __name__ == '__main__':
+def post_worker_init(worker):
+    """
+    Initialize the chatbot in each worker after gevent monkey-patching.
+
+    Gunicorn's gevent worker runs monkey.patch_all() in init_process,
+    *after* post_fork but *before* this hook. Initializing in post_fork
+    would create the QueryBatcher's thread, queue and futures with
+    unpatched primitives, and gevent synchronization objects are not
+    safe to signal from a raw OS thread - requests would hang waiting on
+    their futures. This hook runs post-patch, so everything the batcher
+    creates is gevent-aware.
+    """
+    try:
+        # Blocking gRPC calls (the Qdrant client prefers gRPC) would
+        # otherwise stall the gevent hub for the whole worker
+        import grpc.experimental.gevent
+        grpc.experimental.gevent.init_gevent()
+    except ImportError:
+        pass
+
     initialize_chatbot()
+
+
+def run_production_server(host, port):
+    """Run the service under Gunicorn with gevent workers."""
+    from gunicorn.app.base import BaseApplication
+
+    class ChatbotApplication(BaseApplication):
+        """Embedded Gunicorn application wrapping the Flask app."""
+
+        def __init__(self, wsgi_app, options):
+            self.wsgi_app = wsgi_app
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            return self.wsgi_app
+
+    options = {
+        'bind': f'{host}:{port}',
+        'worker_class': 'gevent',
+        'workers': 2 * (os.cpu_count() or 1) + 1,
+        'worker_connections': 1000,
+        'timeout': 120,
+        # Initialize and pre-warm in each worker process, not the
+        # master, so gRPC channels and threads survive the fork; must
+        # run after gevent monkey-patching (see post_worker_init)
+        'post_worker_init': post_worker_init,
+    }
+    ChatbotApplication(app, options).run()
+
+
+if __name__ == '__main__':
     port = int(os.getenv('CHATBOT_SERVICE_PORT', 5001))
     host = os.getenv('CHATBOT_SERVICE_HOST', '0.0.0.0')
-    print(f"Starting SSE-enabled chatbot service on {host}:{port}", file=sys.stderr)
-    app.run(host=host, port=port, debug=False, threaded=True)
+
+    try:
+        print(f"Starting SSE-enabled chatbot service (gunicorn/gevent) on {host}:{port}", file=sys.stderr)
+        run_production_server(host, port)
+    except ImportError:
+        # Development fallback: Werkzeug's threaded server
+        print("Gunicorn/gevent not installed, falling back to Flask dev server", file=sys.stderr)
+        initialize_chatbot()
+        print(f"Starting SSE-enabled chatbot service on {host}:{port}", file=sys.stderr)
+        app.run(host=host, port=port, debug=False, threaded=True)
@@ -159,6 +159,183 @@ class ChatbotGraph:
         
         return answer
     
+    def execute_stream(self, query: str, user_id: str, session_id: str):
+        """
+        Execute the chatbot pipeline, streaming answer deltas.
+
+        Runs the routing/retrieval/validation nodes synchronously, then
+        streams LLM tokens as they arrive instead of buffering the full
+        answer. Memory update and Q&A auto-ingestion happen after the
+        stream completes.
+
+        Args:
+            query: User query
+            user_id: Unique user identifier
+            session_id: User session identifier
+
+        Yields:
+            Answer text deltas
+        """
+        from config.settings import EXACT_MATCH_THRESHOLD
+
+        # Retrieve conversation history for context
+        conversation_history = self.memory.get_history(user_id, session_id)
+        formatted_history = self.memory.get_formatted_history(user_id, session_id)
+
+        state: ChatbotState = {
+            "query": query,
+            "user_id": user_id,
+            "session_id": session_id,
+            "conversation_history": conversation_history,
+            "formatted_history": formatted_history,
+            "intent": None,
+            "pipeline": None,
+            "retrieved_docs": [],
+            "retrieval_valid": False,
+            "filtered_docs": [],
+            "gemini_response": None,
+            "answer": None
+        }
+
+        # Route, retrieve and validate synchronously (fast stages)
+        state = self.nodes.route_node(state)
+        if state.get("pipeline") == "RAG":
+            state = self.nodes.retrieve_node(state)
+            state = self.nodes.validate_node(state)
+
+        answer_parts = []
+        use_external = not state.get("retrieval_valid", False)
+
+        if not use_external:
+            filtered_docs = state.get("filtered_docs", [])
+
+            # Cached Q&A pairs with very high similarity are returned whole
+            cached_answer = None
+            for doc in filtered_docs:
+                metadata = doc.get('metadata', {})
+                if (metadata.get('document_type', '') == 'Generated Q&A'
+                        and doc.get('similarity_score', 0) >= EXACT_MATCH_THRESHOLD):
+                    cached_answer = metadata.get('answer', '')
+                    if cached_answer:
+                        break
+
+            if cached_answer:
+                answer_parts.append(cached_answer)
+                cleaned = self._clean_response(cached_answer)
+                if cleaned:
+                    yield cleaned
+            else:
+                # Stream a fresh RAG answer token by token
+                context = self.nodes.retriever.format_retrieved_context(filtered_docs)
+                yield from self._clean_stream(
+                    self.nodes.gemini_llm.generate_rag_answer_stream(
+                        context=context,
+                        question=query,
+                        conversation_history=formatted_history),
+                    answer_parts
+                )
+        else:
+            # External path: stream Gemini directly
+            yield from self._clean_stream(
+                self.nodes.gemini_llm.generate_response_stream(
+                    question=query,
+                    conversation_history=formatted_history),
+                answer_parts
+            )
+
+        answer = "".join(answer_parts)
+        state["answer"] = answer
+
+        # Post-stream bookkeeping: memory update and Q&A auto-ingestion
+        self.nodes.memory_node(state)
+
+        if use_external and answer:
+            try:
+                self.nodes.retriever.ingest_qa_pair(query, answer)
+            except Exception as e:
+                print(f"Error during auto-ingestion: {e}", file=sys.stderr)
+
+    # Matches the Intent:/Entity: debug label lines _clean_response strips
+    _LABEL_RE = re.compile(r'^\s*(Intent|Entity):\s*', re.IGNORECASE)
+
+    @staticmethod
+    def _could_be_label(fragment: str) -> bool:
+        """Check whether a partial line could still grow into a label line."""
+        prefix = fragment.lstrip().lower()
+        return 'intent:'.startswith(prefix) or 'entity:'.startswith(prefix)
+
+    def _clean_stream(self, deltas, raw_parts: list):
+        """
+        Clean a stream of answer deltas, dropping intent/entity label lines.
+
+        Streaming counterpart of _clean_response: whole "Intent:" /
+        "Entity:" lines are suppressed as they complete, everything else
+        passes through at token granularity. The start of a line is only
+        held back while it could still turn out to be a label prefix.
+        Raw deltas are also collected into raw_parts so the caller can
+        reassemble the uncleaned answer for memory and ingestion.
+
+        Args:
+            deltas: Iterable of raw answer text deltas
+            raw_parts: List that receives every raw delta
+
+        Yields:
+            Cleaned answer text deltas
+        """
+        held = ""  # Unemitted start of the current line
+        mode = "undecided"  # undecided | pass (emit line) | drop (label line)
+
+        for delta in deltas:
+            if not delta:
+                continue
+            raw_parts.append(delta)
+
+            text = held + delta
+            held = ""
+            out = []
+
+            while text:
+                newline = text.find('\n')
+
+                if mode == "pass":
+                    # Emit the rest of the current non-label line
+                    if newline == -1:
+                        out.append(text)
+                        text = ""
+                    else:
+                        out.append(text[:newline + 1])
+                        text = text[newline + 1:]
+                        mode = "undecided"
+                elif mode == "drop":
+                    # Swallow the rest of the current label line
+                    if newline == -1:
+                        text = ""
+                    else:
+                        text = text[newline + 1:]
+                        mode = "undecided"
+                elif newline == -1:
+                    # Incomplete line: decide as soon as the prefix allows
+                    if self._LABEL_RE.match(text):
+                        mode = "drop"
+                    elif self._could_be_label(text):
+                        held = text
+                    else:
+                        out.append(text)
+                        mode = "pass"
+                    text = ""
+                else:
+                    # Complete line: drop it if it is a label
+                    line, text = text[:newline + 1], text[newline + 1:]
+                    if not self._LABEL_RE.match(line):
+                        out.append(line)
+
+            chunk = "".join(out)
+            if chunk:
+                yield chunk
+
+        if held and not self._LABEL_RE.match(held):
+            yield held
+
     def _clean_response(self, response: str) -> str:
         """
         Clean response by removing intent/entity labels and other debug information.
@@ -1,90 +1,268 @@
 """
 Embedding generation module using sentence transformers.
 Generates vector embeddings for text chunks.
+
+Prefers an ONNX Runtime INT8-quantized backend on CPU (3-6x faster than
+the PyTorch path for MiniLM-class models) and falls back to the original
+sentence-transformers implementation when the ONNX stack is unavailable.
 """
 
+import os
+import shutil
 from typing import List
-from sentence_transformers import SentenceTransformer
+
 import numpy as np
 
 class EmbeddingGenerator:
     """Generates embeddings using sentence transformers."""
-    
+
     def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
         """
         Initialize the embedding generator.
-        
+
         Args:
             model_name: Name of the sentence transformer model
         """
         self.model_name = model_name
         self.model = None
+        self.backend = None
+        self.session = None
+        self.tokenizer = None
+        self.embedding_dimension = None
         self._load_model()
-    
+
     def _load_model(self):
-        """Load the sentence transformer model."""
+        """Load the ONNX backend, falling back to sentence transformers."""
+        try:
+            self._load_onnx_model()
+            self.backend = "onnx"
+            print(f"Embedding model loaded with ONNX Runtime (INT8): {self.model_name}")
+            return
+        except Exception as e:
+            print(f"ONNX Runtime backend unavailable ({e}), falling back to PyTorch")
+
         try:
             print(f"Loading embedding model: {self.model_name}")
+            from sentence_transformers import SentenceTransformer
+
+            # Use all cores for the CPU-bound PyTorch forward pass
+            try:
+                import torch
+                torch.set_num_threads(os.cpu_count() or 1)
+            except ImportError:
+                pass
+
             self.model = SentenceTransformer(self.model_name)
+            self.backend = "torch"
+            self.embedding_dimension = self.model.get_sentence_embedding_dimension()
             print("Embedding model loaded successfully")
         except Exception as e:
             print(f"Error loading embedding model: {e}")
             raise
-    
+
+    def _load_onnx_model(self):
+        """Load the INT8-quantized ONNX model and fast tokenizer."""
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        model_path = self._export_quantized_model()
+
+        sess_options = onnxruntime.SessionOptions()
+        sess_options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+
+        self.session = onnxruntime.InferenceSession(
+            model_path,
+            sess_options=sess_options,
+            providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
+
+        # Probe the output shape once to learn the embedding dimension
+        probe = self._encode_onnx(["dimension probe"])
+        self.embedding_dimension = probe.shape[1]
+
+    def _export_quantized_model(self) -> str:
+        """
+        Export and INT8-quantize the model to ONNX, caching on disk.
+
+        The one-time export is serialized with a file lock and staged in
+        a temporary directory that is atomically renamed into place, so
+        concurrent worker processes (e.g. several gunicorn workers
+        booting with an empty cache) never see or hand each other a
+        partially-written model: one worker exports, the rest wait on
+        the lock and find the finished files.
+
+        Returns:
+            Path to the quantized ONNX model file
+        """
+        cache_dir = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "onnx_models",
+            self.model_name.split("/")[-1]
+        )
+        quantized_path = os.path.join(cache_dir, "model_quantized.onnx")
+
+        if os.path.exists(quantized_path):
+            return quantized_path
+
+        os.makedirs(os.path.dirname(cache_dir), exist_ok=True)
+        lock_path = cache_dir + ".lock"
+
+        with open(lock_path, "w") as lock_file:
+            try:
+                import fcntl
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            except ImportError:
+                pass  # No flock on this platform; assume single process
+
+            # Another worker may have finished the export while we
+            # waited on the lock
+            if os.path.exists(quantized_path):
+                return quantized_path
+
+            print(f"Exporting {self.model_name} to INT8 ONNX (one-time)...")
+            from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+            tmp_dir = cache_dir + ".tmp"
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir)
+
+            model = ORTModelForFeatureExtraction.from_pretrained(
+                self.model_name, export=True
+            )
+            model.save_pretrained(tmp_dir)
+
+            quantizer = ORTQuantizer.from_pretrained(tmp_dir)
+            quantizer.quantize(
+                save_dir=tmp_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False)
+            )
+
+            # Publish atomically; clear any stale partial export from a
+            # previous crashed run first
+            if os.path.exists(cache_dir):
+                shutil.rmtree(cache_dir)
+            os.replace(tmp_dir, cache_dir)
+            print(f"Quantized model saved to: {cache_dir}")
+
+        return quantized_path
+
+    def _encode_onnx(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts with the ONNX session and mean pooling.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            Array of embeddings with shape (len(texts), dim)
+        """
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            return_tensors="np"
+        )
+
+        input_names = {inp.name for inp in self.session.get_inputs()}
+        inputs = {
+            name: np.asarray(value, dtype=np.int64)
+            for name, value in encoded.items()
+            if name in input_names
+        }
+
+        token_embeddings = self.session.run(None, inputs)[0]
+
+        # Mean pooling over non-padding tokens
+        attention_mask = inputs["attention_mask"][..., np.newaxis].astype(np.float32)
+        summed = (token_embeddings * attention_mask).sum(axis=1)
+        counts = np.clip(attention_mask.sum(axis=1), 1e-9, None)
+        pooled = (summed / counts).astype(np.float32)
+
+        # L2-normalize so dot product equals cosine similarity
+        norms = np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return np.ascontiguousarray(pooled / norms, dtype=np.float32)
+
     def generate_embedding(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text.
-        
+
         Args:
             text: Input text
-            
+
         Returns:
             Embedding vector as numpy array
         """
-        if not self.model:
+        if not self.backend:
             raise RuntimeError("Embedding model not loaded")
-        
+
         if not text:
-            return np.zeros(self.model.get_sentence_embedding_dimension())
-        
-        embedding = self.model.encode(text, convert_to_numpy=True)
-        return embedding
-    
+            return np.zeros(self.get_embedding_dimension())
+
+        if self.backend == "onnx":
+            return self._encode_onnx([text])[0]
+
+        embedding = self.model.encode(
+            text, convert_to_numpy=True, normalize_embeddings=True
+        )
+        return np.ascontiguousarray(embedding, dtype=np.float32)
+
     def generate_embeddings(self, texts: List[str], batch_size: int = 32) -> List[np.ndarray]:
         """
         Generate embeddings for multiple texts.
-        
+
         Args:
             texts: List of input texts
             batch_size: Batch size for encoding
-            
+
         Returns:
             List of embedding vectors
         """
-        if not self.model:
+        if not self.backend:
             raise RuntimeError("Embedding model not loaded")
-        
+
         if not texts:
             return []
-        
+
         print(f"Generating embeddings for {len(texts)} texts...")
+
+        if self.backend == "onnx":
+            # Smart batching: sort by tokenized length so each batch only
+            # pads to its own longest member, then restore input order
+            token_ids = self.tokenizer(texts, truncation=True)["input_ids"]
+            order = sorted(range(len(texts)), key=lambda i: len(token_ids[i]))
+
+            embeddings = np.empty(
+                (len(texts), self.embedding_dimension), dtype=np.float32
+            )
+            for start in range(0, len(order), batch_size):
+                batch_indices = order[start:start + batch_size]
+                embeddings[batch_indices] = self._encode_onnx(
+                    [texts[i] for i in batch_indices]
+                )
+            return embeddings.tolist()
+
         embeddings = self.model.encode(
             texts,
             batch_size=batch_size,
             convert_to_numpy=True,
+            normalize_embeddings=True,
             show_progress_bar=True
         )
-        
+
         return embeddings.tolist()
-    
+
     def get_embedding_dimension(self) -> int:
         """
         Get the dimension of embeddings.
-        
+
         Returns:
             Embedding dimension
         """
-        if not self.model:
+        if not self.backend:
             raise RuntimeError("Embedding model not loaded")
-        
-        return self.model.get_sentence_embedding_dimension()
+
+        return self.embedding_dimension
@@ -4,7 +4,16 @@ Supports both local Docker and cloud deployments.
 """
 
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import (
+    Distance,
+    VectorParams,
+    PointStruct,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    HnswConfigDiff,
+    OptimizersConfigDiff,
+)
 from typing import List, Dict, Any
 import uuid
 
@@ -48,13 +57,7 @@ class QdrantIndexer:
             
             if self.collection_name not in collection_names:
                 # Create collection
-                self.client.create_collection(
-                    collection_name=self.collection_name,
-                    vectors_config=VectorParams(
-                        size=self.vector_size,
-                        distance=Distance.COSINE
-                    )
-                )
+                self._create_collection()
                 print(f"Created new collection: {self.collection_name}")
             else:
                 print(f"Using existing collection: {self.collection_name}")
@@ -67,6 +70,41 @@ class QdrantIndexer:
             print(f"Error initializing Qdrant client: {e}")
             raise
     
+    def _create_collection(self):
+        """
+        Create the collection with INT8 quantization and on-disk vectors.
+
+        Raw fp32 vectors are kept on disk while INT8-quantized copies
+        stay in RAM, cutting resident memory ~4x and using SIMD integer
+        distance during ANN search. Searches rescore against the raw
+        vectors, so recall is essentially unchanged. The HNSW graph is
+        also memory-mapped from disk so the collection stays serviceable
+        when the corpus outgrows RAM.
+        """
+        self.client.create_collection(
+            collection_name=self.collection_name,
+            vectors_config=VectorParams(
+                size=self.vector_size,
+                distance=Distance.COSINE,
+                on_disk=True
+            ),
+            hnsw_config=HnswConfigDiff(
+                on_disk=True,
+                m=32,
+                ef_construct=200
+            ),
+            optimizers_config=OptimizersConfigDiff(
+                memmap_threshold=20000
+            ),
+            quantization_config=ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True
+                )
+            )
+        )
+
     def add_documents(self, documents: List[Dict[str, Any]], embeddings: List[List[float]]):
         """
         Add documents with embeddings to the collection.
@@ -131,13 +169,7 @@ class QdrantIndexer:
             print(f"Deleted collection: {self.collection_name}")
             
             # Recreate collection
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=VectorParams(
-                    size=self.vector_size,
-                    distance=Distance.COSINE
-                )
-            )
+            self._create_collection()
             print(f"Created new collection: {self.collection_name}")
             
         except Exception as e:
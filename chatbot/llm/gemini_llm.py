@@ -134,6 +134,82 @@ class GeminiLLM:
             print(f"Unexpected error in Gemini API: {type(e).__name__}: {e}")
             return "Something unexpected happened! 😬 But don't worry - try asking me something else!"
     
+    def _call_api_stream(self, prompt: str):
+        """
+        Stream response text from Gemini as it is generated.
+
+        Uses the streamGenerateContent endpoint with SSE framing and
+        yields text deltas as they arrive. Falls back to the blocking
+        API (yielding the full response as one delta) if streaming
+        fails before any text was produced.
+
+        Args:
+            prompt: Full prompt text
+
+        Yields:
+            Response text deltas
+        """
+        emitted = False
+        try:
+            url = f"{self.base_url}/{self.model_name}:streamGenerateContent"
+
+            payload = {
+                "contents": [{
+                    "parts": [{"text": prompt}]
+                }],
+                "generationConfig": {
+                    "temperature": self.temperature,
+                    "maxOutputTokens": self.max_tokens
+                }
+            }
+
+            response = requests.post(
+                url,
+                headers={"Content-Type": "application/json"},
+                params={"key": self.api_key, "alt": "sse"},
+                data=json.dumps(payload),
+                stream=True,
+                timeout=60
+            )
+
+            if response.status_code != 200:
+                print(f"Gemini streaming API HTTP Error {response.status_code}: {response.text}")
+                yield self._call_api(prompt)
+                return
+
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+
+                try:
+                    chunk = json.loads(data)
+                except json.JSONDecodeError:
+                    continue
+
+                candidates = chunk.get('candidates') or []
+                if not candidates:
+                    continue
+
+                parts = candidates[0].get('content', {}).get('parts') or []
+                for part in parts:
+                    text = part.get('text', '')
+                    if text:
+                        emitted = True
+                        yield text
+
+        except requests.exceptions.RequestException as e:
+            print(f"Gemini streaming API request error: {e}")
+            if not emitted:
+                yield self._call_api(prompt)
+        except Exception as e:
+            print(f"Unexpected error in Gemini streaming API: {type(e).__name__}: {e}")
+            if not emitted:
+                yield self._call_api(prompt)
+
     def generate_response(self, question: str, conversation_history: str = "") -> str:
         """
         Generate response for a question.
@@ -151,6 +227,23 @@ class GeminiLLM:
             prompt = f"{GEMINI_SYSTEM_PROMPT}\n\nUser Question: {question}\n\nAssistant:"
         return self._call_api(prompt)
     
+    def generate_response_stream(self, question: str, conversation_history: str = ""):
+        """
+        Stream response deltas for a question.
+
+        Args:
+            question: User question
+            conversation_history: Optional formatted conversation history
+
+        Yields:
+            Response text deltas
+        """
+        if conversation_history:
+            prompt = f"{GEMINI_SYSTEM_PROMPT}\n\n{conversation_history}\n\nUser Question: {question}\n\nAssistant:"
+        else:
+            prompt = f"{GEMINI_SYSTEM_PROMPT}\n\nUser Question: {question}\n\nAssistant:"
+        yield from self._call_api_stream(prompt)
+
     def generate_with_context(self, question: str, context: str) -> str:
         """
         Generate response with additional context.
@@ -183,3 +276,22 @@ class GeminiLLM:
             prompt = f"{GEMINI_SYSTEM_PROMPT}\n\nRelevant Context:\n{context}\n\nUser Question: {question}\n\nAssistant:"
         return self._call_api(prompt)
 
+    def generate_rag_answer_stream(self, context: str, question: str,
+                                   conversation_history: str = ""):
+        """
+        Stream RAG answer deltas with retrieved context and history.
+
+        Args:
+            context: Retrieved context from vector database
+            question: User question
+            conversation_history: Optional formatted conversation history
+
+        Yields:
+            Response text deltas
+        """
+        if conversation_history:
+            prompt = f"{GEMINI_SYSTEM_PROMPT}\n\n{conversation_history}\n\nRelevant Context:\n{context}\n\nUser Question: {question}\n\nAssistant:"
+        else:
+            prompt = f"{GEMINI_SYSTEM_PROMPT}\n\nRelevant Context:\n{context}\n\nUser Question: {question}\n\nAssistant:"
+        yield from self._call_api_stream(prompt)
+
@@ -95,6 +95,28 @@ class RAGChatbot:
         
         return response
     
+    def query_stream(self, user_query: str, user_id: str, session_id: str):
+        """
+        Process a user query, streaming the response as it is generated.
+
+        Args:
+            user_query: The user's question
+            user_id: Unique user identifier
+            session_id: User session identifier
+
+        Yields:
+            Response text deltas
+        """
+        if not user_query or not user_query.strip():
+            yield "Please provide a valid question."
+            return
+
+        if not user_id or not session_id:
+            yield "User ID and session ID are required."
+            return
+
+        yield from self.graph.execute_stream(user_query, user_id, session_id)
+
     def clear_session(self, user_id: str, session_id: str):
         """
         Clear conversation history for a session.
@@ -0,0 +1,80 @@
+"""
+Similarity kernels for the retrieval hot path.
+
+Uses Numba-JIT compiled loops (parallel, fastmath) when numba is
+installed, falling back to NumPy/BLAS otherwise. All kernels assume
+L2-normalized float32 vectors, so dot product equals cosine similarity.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _similarities_numba(matrix, query):
+        """Dot product of each matrix row with the query vector."""
+        n, dim = matrix.shape
+        out = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            acc = np.float32(0.0)
+            for j in range(dim):
+                acc += matrix[i, j] * query[j]
+            out[i] = acc
+        return out
+
+
+def cosine_similarities(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """
+    Compute cosine similarities of a query against a matrix of vectors.
+
+    Args:
+        matrix: Contiguous float32 array of shape (N, dim), L2-normalized
+        query: Float32 vector of shape (dim,), L2-normalized
+
+    Returns:
+        Float32 array of N similarities
+    """
+    if NUMBA_AVAILABLE:
+        return _similarities_numba(matrix, query)
+    return matrix @ query
+
+
+def best_match(matrix: np.ndarray, query: np.ndarray) -> tuple:
+    """
+    Find the most similar row to the query.
+
+    Args:
+        matrix: Contiguous float32 array of shape (N, dim), L2-normalized
+        query: Float32 vector of shape (dim,), L2-normalized
+
+    Returns:
+        Tuple of (row index, similarity); (-1, -1.0) for an empty matrix
+    """
+    if matrix.shape[0] == 0:
+        return -1, -1.0
+
+    similarities = cosine_similarities(matrix, query)
+    index = int(np.argmax(similarities))
+    return index, float(similarities[index])
+
+
+def warmup(dim: int = 384):
+    """
+    Trigger JIT compilation on dummy inputs.
+
+    Call at startup so the first real request doesn't pay the compile
+    cost. A no-op when numba is not installed.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+
+    matrix = np.zeros((2, dim), dtype=np.float32)
+    query = np.zeros(dim, dtype=np.float32)
+    _similarities_numba(matrix, query)
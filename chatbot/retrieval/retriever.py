@@ -3,11 +3,256 @@ Retrieval module for similarity search using Qdrant.
 Performs vector similarity search to find relevant documents.
 """
 
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
 from qdrant_client import QdrantClient
-from qdrant_client.models import Filter, FieldCondition, MatchValue
+from qdrant_client.models import (
+    Filter,
+    FieldCondition,
+    MatchValue,
+    SearchParams,
+    QuantizationSearchParams,
+)
 from typing import List, Dict, Any, Optional
 from ingestion.embeddings import EmbeddingGenerator
 from retrieval.query_processor import QueryProcessor
+from retrieval import _kernels
+
+# Module logger: retrieval logging is debug-level so the hot path emits
+# nothing (and takes no stdout lock) at the production WARNING level
+logger = logging.getLogger(__name__)
+
+# Shared Qdrant clients keyed by (url, api_key). QdrantClient is
+# thread-safe, so all Flask worker threads reuse one gRPC channel
+# instead of paying a TCP/TLS handshake per Retriever instance.
+_CLIENT_REGISTRY: Dict[tuple, QdrantClient] = {}
+_CLIENT_REGISTRY_LOCK = threading.Lock()
+
+
+def get_shared_client(url: str, api_key: Optional[str] = None) -> QdrantClient:
+    """
+    Get or create the shared Qdrant client for a server.
+
+    Args:
+        url: Qdrant server URL
+        api_key: API key for Qdrant Cloud (None for local)
+
+    Returns:
+        Shared QdrantClient instance for this (url, api_key)
+    """
+    key = (url, api_key)
+    with _CLIENT_REGISTRY_LOCK:
+        client = _CLIENT_REGISTRY.get(key)
+        if client is None:
+            client = QdrantClient(
+                url=url,
+                api_key=api_key,
+                prefer_grpc=True,
+                grpc_port=6334,
+                timeout=60,
+                grpc_options={
+                    "grpc.keepalive_time_ms": 30000,
+                    "grpc.max_send_message_length": 32 * 1024 * 1024,
+                }
+            )
+            _CLIENT_REGISTRY[key] = client
+        return client
+
+
+class ExactMatchCache:
+    """
+    Exact-match LRU cache with TTL for retrieval results.
+
+    Sits in front of the embedder: verbatim repeats of a query (common
+    within a chat session) short-circuit both the embedding forward pass
+    and the Qdrant round trip. Entries expire after a TTL so results do
+    not go stale, and the whole cache is cleared when new data is
+    ingested. Thread-safe via an RLock.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 300.0):
+        """
+        Initialize the exact-match cache.
+
+        Args:
+            max_entries: Maximum number of cached queries
+            ttl_seconds: Time-to-live for each entry in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (timestamp, retrieved_docs)
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(search_query: str, top_k: int,
+                 filter_by: Optional[Dict[str, str]]) -> tuple:
+        """Build a hashable cache key from the retrieval arguments."""
+        filter_key = frozenset(filter_by.items()) if filter_by else None
+        return (search_query, top_k, filter_key)
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        """
+        Look up cached results for a key.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            (retrieved_docs, formatted_context) tuple, or None on miss/expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            timestamp, retrieved_docs, formatted_context = entry
+            if time.monotonic() - timestamp > self.ttl_seconds:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return copy.deepcopy(retrieved_docs), formatted_context
+
+    def put(self, key: tuple, retrieved_docs: List[Dict[str, Any]],
+            formatted_context: str):
+        """
+        Store retrieval results under a key.
+
+        Args:
+            key: Cache key from make_key()
+            retrieved_docs: Retrieved documents to cache
+            formatted_context: Pre-formatted context string for the docs
+        """
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic(), copy.deepcopy(retrieved_docs), formatted_context
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Clear all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SemanticQueryCache:
+    """
+    Bounded semantic cache for retrieval results.
+
+    Stores L2-normalized query embeddings in a single matrix so a lookup
+    is one matrix-vector product; queries whose cosine similarity to a
+    cached query exceeds the threshold reuse the cached results without
+    touching the embedder output or Qdrant again. Entries are evicted in
+    LRU order once the cache is full. Thread-safe via an RLock.
+    """
+
+    def __init__(self,
+                 threshold: float = 0.97,
+                 max_entries: int = 2000,
+                 embedding_dim: int = 384):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity to count as a cache hit
+            max_entries: Maximum number of cached queries
+            embedding_dim: Dimension of query embeddings
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.embedding_dim = embedding_dim
+        self._embeddings = np.zeros((max_entries, embedding_dim), dtype=np.float32)
+        self._entries = [None] * max_entries  # Parallel payloads per slot
+        self._lru = deque()  # Slot indices, oldest first
+        self._size = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        """Return the L2-normalized copy of an embedding as float32."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+        return vector
+
+    def lookup(self, query_embedding: np.ndarray, top_k: int) -> Optional[tuple]:
+        """
+        Look up cached results for a query embedding.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results the caller expects
+
+        Returns:
+            (retrieved_docs, formatted_context) tuple, or None on a miss
+        """
+        query_vector = self._normalize(query_embedding)
+
+        with self._lock:
+            if self._size == 0:
+                return None
+
+            # Single pass over all cached (normalized) embeddings,
+            # JIT-compiled when numba is available
+            best_slot, best_sim = _kernels.best_match(
+                self._embeddings[:self._size], query_vector
+            )
+
+            if best_sim < self.threshold:
+                return None
+
+            cached_k, cached_docs, cached_context = self._entries[best_slot]
+            if cached_k != top_k:
+                return None
+
+            # Refresh LRU position for the hit
+            self._lru.remove(best_slot)
+            self._lru.append(best_slot)
+
+            # Deep copy so callers can't mutate cached payloads
+            return copy.deepcopy(cached_docs), cached_context
+
+    def insert(self, query_embedding: np.ndarray, top_k: int,
+               retrieved_docs: List[Dict[str, Any]],
+               formatted_context: str):
+        """
+        Insert retrieval results into the cache.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results that were requested
+            retrieved_docs: Retrieved documents to cache
+            formatted_context: Pre-formatted context string for the docs
+        """
+        query_vector = self._normalize(query_embedding)
+
+        with self._lock:
+            if self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                # Evict least recently used entry and reuse its slot
+                slot = self._lru.popleft()
+
+            self._embeddings[slot] = query_vector
+            self._entries[slot] = (top_k, copy.deepcopy(retrieved_docs), formatted_context)
+            self._lru.append(slot)
+
+    def clear(self):
+        """Clear all cached entries."""
+        with self._lock:
+            self._entries = [None] * self.max_entries
+            self._lru.clear()
+            self._size = 0
+
 
 class Retriever:
     """Handles similarity search and document retrieval using Qdrant."""
@@ -35,20 +280,35 @@ class Retriever:
         self.client = None
         self.embedding_generator = EmbeddingGenerator(embedding_model)
         self.query_processor = QueryProcessor()  # Add query processor
+        self.semantic_cache = SemanticQueryCache()
+        self.exact_cache = ExactMatchCache()
+        # Embeddings of raw queries that were embedded verbatim during
+        # retrieval, kept briefly so a follow-up ingest_qa_pair for the
+        # same question can reuse them
+        self._query_embeddings = OrderedDict()
+        self._query_embeddings_lock = threading.Lock()
+        # Search INT8-quantized vectors with a bounded HNSW beam width,
+        # rescoring hits against the raw on-disk fp32 vectors to
+        # preserve recall
+        self.search_params = SearchParams(
+            hnsw_ef=64,
+            quantization=QuantizationSearchParams(
+                rescore=True,
+                oversampling=2.0
+            )
+        )
         self._initialize_client()
     
     def _initialize_client(self):
         """Initialize Qdrant client."""
         try:
-            self.client = QdrantClient(
-                url=self.url,
-                api_key=self.api_key,
-                timeout=60
-            )
-            print(f"Retriever initialized with collection: {self.collection_name}")
+            # Shared gRPC client: one persistent channel per server,
+            # reused across Retriever instances and worker threads
+            self.client = get_shared_client(self.url, self.api_key)
+            logger.info(f"Retriever initialized with collection: {self.collection_name}")
             
         except Exception as e:
-            print(f"Error initializing retriever: {e}")
+            logger.error(f"Error initializing retriever: {e}")
             raise
     
     def retrieve(self, 
@@ -66,28 +326,72 @@ class Retriever:
         Returns:
             List of retrieved documents with metadata and scores
         """
+        retrieved_docs, _ = self.retrieve_with_context(query, top_k, filter_by)
+        return retrieved_docs
+
+    def retrieve_with_context(self,
+                              query: str,
+                              top_k: Optional[int] = None,
+                              filter_by: Optional[Dict[str, str]] = None) -> tuple:
+        """
+        Retrieve relevant documents and their formatted context string.
+
+        The context string is deterministic given the retrieved
+        documents, so it is computed once on a cache miss and stored
+        alongside the documents; cache hits return it for free.
+
+        Args:
+            query: User query text
+            top_k: Number of results to retrieve (overrides default)
+            filter_by: Optional metadata filters (e.g., {"company": "Google"})
+
+        Returns:
+            Tuple of (retrieved documents, formatted context string)
+        """
         if not query:
-            return []
-        
+            return [], ""
+
         k = top_k if top_k is not None else self.top_k
-        
+
         try:
             # Preprocess query
             processed = self.query_processor.process_query(query)
             normalized_query = processed['normalized']
             keyword_query = processed['keyword_query']
             
-            # Log preprocessing for debugging
-            print(f"Original query: {query}")
-            print(f"Normalized: {normalized_query}")
-            print(f"Keywords: {keyword_query}")
+            # Log preprocessing for debugging (gated by log level so the
+            # hot path stays free of stdout lock contention)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Original query: {query}")
+                logger.debug(f"Normalized: {normalized_query}")
+                logger.debug(f"Keywords: {keyword_query}")
             
             # Use keyword query if it has content, otherwise use normalized
             search_query = keyword_query if keyword_query else normalized_query
-            
-            # Generate query embedding
+
+            # Check exact-match cache before paying for an embedding
+            cache_key = ExactMatchCache.make_key(search_query, k, filter_by)
+            cached = self.exact_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Exact cache hit: returning {len(cached[0])} documents")
+                return cached
+
+            # Generate query embedding. Only remember it when the
+            # search text is the raw query verbatim - otherwise a later
+            # ingest_qa_pair would recall the processed-query vector and
+            # store it against the raw question payload
             query_embedding = self.embedding_generator.generate_embedding(search_query)
-            
+            if search_query == query:
+                self._remember_query_embedding(query, query_embedding)
+
+            # Check semantic cache for a near-duplicate query (skip when
+            # filtering, since cached results may not satisfy the filter)
+            if not filter_by:
+                cached = self.semantic_cache.lookup(query_embedding, k)
+                if cached is not None:
+                    logger.debug(f"Semantic cache hit: returning {len(cached[0])} documents")
+                    return cached
+
             # Prepare filter if provided
             query_filter = None
             if filter_by:
@@ -104,37 +408,197 @@ class Retriever:
             # Perform similarity search
             search_results = self.client.query_points(
                 collection_name=self.collection_name,
-                query=query_embedding.tolist(),
+                query=query_embedding,
                 limit=k,
                 query_filter=query_filter,
+                search_params=self.search_params,
                 with_payload=True,
                 with_vectors=False
             ).points
-            
-            # Format results
-            retrieved_docs = []
-            
-            for result in search_results:
-                # Extract payload
-                payload = result.payload
-                content = payload.pop('content', '')
-                
-                # Similarity score (Qdrant returns score directly for cosine)
-                similarity_score = result.score
-                
-                retrieved_docs.append({
-                    'content': content,
-                    'metadata': payload,  # All remaining fields are metadata
-                    'similarity_score': similarity_score
-                })
-            
-            print(f"Retrieved {len(retrieved_docs)} documents")
-            return retrieved_docs
-            
+
+            # Format results and precompute the context string once
+            retrieved_docs = self._format_search_results(search_results)
+            formatted_context = self.format_retrieved_context(retrieved_docs)
+
+            # Cache results for future repeat and near-duplicate queries
+            self.exact_cache.put(cache_key, retrieved_docs, formatted_context)
+            if not filter_by:
+                self.semantic_cache.insert(query_embedding, k, retrieved_docs,
+                                           formatted_context)
+
+            logger.debug(f"Retrieved {len(retrieved_docs)} documents")
+            return retrieved_docs, formatted_context
+
         except Exception as e:
-            print(f"Error during retrieval: {e}")
+            logger.error(f"Error during retrieval: {e}")
+            return [], ""
+
+    def _remember_query_embedding(self, query: str, embedding: np.ndarray,
+                                  max_entries: int = 128):
+        """
+        Remember the embedding computed for a raw query.
+
+        The embedding must have been generated from the query text
+        verbatim, since recall treats it as the query's own vector.
+
+        Args:
+            query: Raw user query text
+            embedding: Embedding of exactly that text
+            max_entries: Maximum number of remembered queries
+        """
+        with self._query_embeddings_lock:
+            self._query_embeddings[query] = embedding
+            self._query_embeddings.move_to_end(query)
+            while len(self._query_embeddings) > max_entries:
+                self._query_embeddings.popitem(last=False)
+
+    def _recall_query_embedding(self, query: str) -> Optional[np.ndarray]:
+        """
+        Recall the embedding remembered for a raw query, if any.
+
+        Args:
+            query: Raw user query text
+
+        Returns:
+            Remembered embedding, or None
+        """
+        with self._query_embeddings_lock:
+            return self._query_embeddings.get(query)
+
+    @staticmethod
+    def _format_search_results(search_results) -> List[Dict[str, Any]]:
+        """
+        Format Qdrant scored points into retrieved document dictionaries.
+
+        Args:
+            search_results: List of ScoredPoint results from Qdrant
+
+        Returns:
+            List of documents with content, metadata and similarity score
+        """
+        retrieved_docs = []
+
+        for result in search_results:
+            # Extract payload
+            payload = result.payload
+            content = payload.pop('content', '')
+
+            # Similarity score (Qdrant returns score directly for cosine)
+            similarity_score = result.score
+
+            retrieved_docs.append({
+                'content': content,
+                'metadata': payload,  # All remaining fields are metadata
+                'similarity_score': similarity_score
+            })
+
+        return retrieved_docs
+
+    def retrieve_many(self,
+                      queries: List[str],
+                      top_k: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieve relevant documents for multiple queries in one batch.
+
+        Embeds all cache-missing queries in a single forward pass and
+        issues one batched Qdrant search instead of one round trip per
+        query. Results are cached the same way as single retrieval.
+
+        Args:
+            queries: List of user query texts
+            top_k: Number of results per query (overrides default)
+
+        Returns:
+            List of retrieved document lists, one per input query
+        """
+        if not queries:
             return []
-    
+
+        k = top_k if top_k is not None else self.top_k
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(queries)
+        miss_indices = []
+
+        # Everything lives inside the try so batch retrieval keeps the
+        # same error contract as retrieve(): failures log and yield
+        # empty lists rather than propagating to callers
+        try:
+            from qdrant_client.models import QueryRequest
+
+            # Resolve cache hits first, collecting misses for the batch
+            miss_queries = []
+            miss_keys = []
+
+            for idx, query in enumerate(queries):
+                if not query:
+                    results[idx] = []
+                    continue
+
+                processed = self.query_processor.process_query(query)
+                search_query = processed['keyword_query'] if processed['keyword_query'] else processed['normalized']
+
+                cache_key = ExactMatchCache.make_key(search_query, k, None)
+                cached = self.exact_cache.get(cache_key)
+                if cached is not None:
+                    results[idx] = cached[0]
+                    continue
+
+                miss_indices.append(idx)
+                miss_queries.append(search_query)
+                miss_keys.append(cache_key)
+
+            if not miss_indices:
+                return results
+
+            # Single batched embedding forward pass for all misses
+            embeddings = self.embedding_generator.generate_embeddings(miss_queries)
+
+            # Semantic cache can still resolve near-duplicate misses
+            pending = []
+            for position, embedding in enumerate(embeddings):
+                embedding = np.asarray(embedding, dtype=np.float32)
+                cached = self.semantic_cache.lookup(embedding, k)
+                if cached is not None:
+                    results[miss_indices[position]] = cached[0]
+                else:
+                    pending.append((position, embedding))
+
+            if pending:
+                # One batched Qdrant call for all remaining queries
+                requests = [
+                    QueryRequest(
+                        query=embedding.tolist(),
+                        limit=k,
+                        params=self.search_params,
+                        with_payload=True,
+                        with_vector=False
+                    )
+                    for _, embedding in pending
+                ]
+                responses = self.client.query_batch_points(
+                    collection_name=self.collection_name,
+                    requests=requests
+                )
+
+                for (position, embedding), response in zip(pending, responses):
+                    retrieved_docs = self._format_search_results(response.points)
+                    formatted_context = self.format_retrieved_context(retrieved_docs)
+                    results[miss_indices[position]] = retrieved_docs
+                    self.exact_cache.put(miss_keys[position], retrieved_docs,
+                                         formatted_context)
+                    self.semantic_cache.insert(embedding, k, retrieved_docs,
+                                               formatted_context)
+
+            logger.debug(f"Batch retrieved documents for {len(queries)} queries "
+                         f"({len(pending)} Qdrant lookups)")
+
+        except Exception as e:
+            logger.error(f"Error during batch retrieval: {e}")
+            for idx in miss_indices:
+                if results[idx] is None:
+                    results[idx] = []
+
+        return [docs if docs is not None else [] for docs in results]
+
     def format_retrieved_context(self, retrieved_docs: List[Dict[str, Any]]) -> str:
         """
         Format retrieved documents into a context string.
@@ -169,103 +633,183 @@ Content:
         
         return "\n---\n".join(context_parts)
     
-    def ingest_qa_pair(self, question: str, answer: str, similarity_threshold: float = 0.95) -> bool:
+    def _qa_duplicate_exists(self, question: str, embedding,
+                             similarity_threshold: float) -> bool:
+        """
+        Check whether a similar generated Q&A pair is already stored.
+
+        Args:
+            question: The question text (for logging)
+            embedding: Question embedding vector
+            similarity_threshold: Similarity above which a pair is a duplicate
+
+        Returns:
+            True if a near-duplicate Q&A already exists
+        """
+        try:
+            search_results = self.client.query_points(
+                collection_name=self.collection_name,
+                query=np.asarray(embedding, dtype=np.float32),
+                limit=5,  # Check top 5 similar documents
+                query_filter=Filter(
+                    must=[
+                        FieldCondition(
+                            key="document_type",
+                            match=MatchValue(value="Generated Q&A")
+                        )
+                    ]
+                ),
+                with_payload=True,
+                with_vectors=False
+            ).points
+
+            # Check if any result is very similar (potential duplicate)
+            for result in search_results:
+                similarity_score = getattr(result, 'score', 0)
+
+                if similarity_score >= similarity_threshold:
+                    existing_question = result.payload.get('question', '')
+                    logger.info(f"⚠ Similar Q&A already exists (similarity: {similarity_score:.4f})")
+                    logger.debug(f"  Existing: {existing_question[:100]}...")
+                    logger.debug(f"  New: {question[:100]}...")
+                    logger.info(f"  → Skipping ingestion to avoid duplicate")
+                    return True
+
+        except Exception as search_error:
+            # If search fails, continue with ingestion (better to have duplicate than lose data)
+            logger.warning(f"Duplicate check failed: {search_error}")
+
+        return False
+
+    @staticmethod
+    def _make_qa_point(question: str, answer: str, embedding):
+        """
+        Build a Qdrant point for a generated Q&A pair.
+
+        Args:
+            question: The user's question
+            answer: The generated answer
+            embedding: Question embedding vector
+
+        Returns:
+            PointStruct ready to upsert
+        """
+        from qdrant_client.models import PointStruct
+        import uuid
+
+        content = f"Question: {question}\n\nAnswer: {answer}"
+
+        return PointStruct(
+            id=str(uuid.uuid4()),
+            vector=list(embedding),
+            payload={
+                "content": content,
+                "document_type": "Generated Q&A",
+                "company": "General Knowledge",
+                "source": "Gemini LLM",
+                "question": question,
+                "answer": answer
+            }
+        )
+
+    def ingest_qa_pairs(self, pairs: List[tuple], similarity_threshold: float = 0.95) -> bool:
+        """
+        Ingest multiple Q&A pairs, embedding all questions in one batch.
+
+        Amortizes the embedder forward pass across all questions instead
+        of one model call per pair, then upserts the non-duplicates with
+        a single Qdrant request.
+
+        Args:
+            pairs: List of (question, answer) tuples
+            similarity_threshold: Threshold to consider a Q&A as duplicate
+
+        Returns:
+            True if successful (duplicates count as success), False on error
+        """
+        pairs = [(q, a) for q, a in pairs if q and a]
+        if not pairs:
+            return False
+
+        try:
+            # One batched forward pass for all questions
+            embeddings = self.embedding_generator.generate_embeddings(
+                [question for question, _ in pairs]
+            )
+
+            points = []
+            for (question, answer), embedding in zip(pairs, embeddings):
+                if self._qa_duplicate_exists(question, embedding, similarity_threshold):
+                    continue
+                points.append(self._make_qa_point(question, answer, embedding))
+
+            if points:
+                self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=points
+                )
+
+                # Invalidate caches so future queries see the new data
+                self.exact_cache.clear()
+                self.semantic_cache.clear()
+
+            logger.info(f"✓ Ingested {len(points)} of {len(pairs)} Q&A pairs into Qdrant")
+            return True
+
+        except Exception as e:
+            logger.exception(f"✗ Error ingesting Q&A pairs: {e}")
+            return False
+
+    def ingest_qa_pair(self, question: str, answer: str,
+                       similarity_threshold: float = 0.95, *,
+                       question_embedding: Optional[np.ndarray] = None) -> bool:
         """
         Ingest a single Q&A pair into Qdrant for future retrieval.
         Checks for duplicates before storing to avoid redundancy.
-        
+
         Args:
             question: The user's question
             answer: The generated answer
             similarity_threshold: Threshold to consider a Q&A as duplicate (default: 0.95)
-            
+            question_embedding: Pre-computed question embedding (skips the
+                embedder forward pass when provided)
+
         Returns:
             True if successful or duplicate found, False on error
         """
         if not question or not answer:
             return False
-        
+
         try:
-            from qdrant_client.models import PointStruct, Filter, FieldCondition, MatchValue
-            import uuid
-            import sys
-            
-            # Generate embedding for the question
-            embedding = self.embedding_generator.generate_embedding(question)
-            
+            # Reuse the embedding computed during retrieval (or passed by
+            # the caller) instead of re-running the embedder
+            embedding = question_embedding
+            if embedding is None:
+                embedding = self._recall_query_embedding(question)
+            if embedding is None:
+                embedding = self.embedding_generator.generate_embedding(question)
+
             # Check if similar Q&A already exists in the database
             # Search only in "Generated Q&A" documents
-            try:
-                search_results = self.client.query_points(
-                    collection_name=self.collection_name,
-                    query=embedding.tolist(),
-                    limit=5,  # Check top 5 similar documents
-                    query_filter=Filter(
-                        must=[
-                            FieldCondition(
-                                key="document_type",
-                                match=MatchValue(value="Generated Q&A")
-                            )
-                        ]
-                    ),
-                    with_payload=True,
-                    with_vectors=False
-                ).points
-                
-                # Check if any result is very similar (potential duplicate)
-                # Note: query_points returns ScoredPoint objects with score attribute
-                for result in search_results:
-                    # Get similarity score (query_points returns score directly)
-                    similarity_score = getattr(result, 'score', 0)
-                    
-                    if similarity_score >= similarity_threshold:
-                        existing_question = result.payload.get('question', '')
-                        print(f"⚠ Similar Q&A already exists (similarity: {similarity_score:.4f})", file=sys.stderr)
-                        print(f"  Existing: {existing_question[:100]}...", file=sys.stderr)
-                        print(f"  New: {question[:100]}...", file=sys.stderr)
-                        print(f"  → Skipping ingestion to avoid duplicate", file=sys.stderr)
-                        return True  # Return True as this is not an error
-                
-            except Exception as search_error:
-                # If search fails, continue with ingestion (better to have duplicate than lose data)
-                print(f"Warning: Duplicate check failed: {search_error}", file=sys.stderr)
-            
+            if self._qa_duplicate_exists(question, embedding, similarity_threshold):
+                return True  # Return True as this is not an error
+
             # No duplicate found, proceed with ingestion
-            print(f"→ No duplicate found, ingesting new Q&A pair", file=sys.stderr)
-            
-            # Create content combining question and answer
-            content = f"Question: {question}\n\nAnswer: {answer}"
-            
-            # Create metadata
-            metadata = {
-                "document_type": "Generated Q&A",
-                "company": "General Knowledge",
-                "source": "Gemini LLM",
-                "question": question,
-                "answer": answer
-            }
-            
-            # Create point
-            point = PointStruct(
-                id=str(uuid.uuid4()),
-                vector=embedding.tolist(),
-                payload={
-                    "content": content,
-                    **metadata
-                }
-            )
-            
+            logger.info(f"→ No duplicate found, ingesting new Q&A pair")
+
             # Upsert to Qdrant
             self.client.upsert(
                 collection_name=self.collection_name,
-                points=[point]
+                points=[self._make_qa_point(question, answer, embedding)]
             )
-            
-            print(f"✓ Q&A pair successfully ingested into Qdrant", file=sys.stderr)
+
+            # Invalidate caches so future queries see the new data
+            self.exact_cache.clear()
+            self.semantic_cache.clear()
+
+            logger.info(f"✓ Q&A pair successfully ingested into Qdrant")
             return True
             
         except Exception as e:
-            print(f"✗ Error ingesting Q&A pair: {e}", file=sys.stderr)
-            import traceback
-            traceback.print_exc(file=sys.stderr)
+            logger.exception(f"✗ Error ingesting Q&A pair: {e}")
             return False
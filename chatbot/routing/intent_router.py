@@ -43,26 +43,46 @@ class IntentRouter:
             'explain', 'what is', 'how does', 'definition', 'understand',
             'teach', 'education', 'knowledge', 'subject'
         ]
-    
-    def _count_keyword_matches(self, text: str, keywords: list) -> int:
+
+        # Precompile one pattern per keyword so classification reuses
+        # compiled matchers instead of rebuilding them per query. Each
+        # keyword is still tested independently, preserving the original
+        # scoring where overlapping keywords (e.g. 'intern' and
+        # 'internship') each count
+        self._compiled_keywords = {
+            self.COMPANY_INTERNSHIP: self._compile_keywords(self.internship_keywords),
+            self.EDUCATION_CODING: self._compile_keywords(self.coding_keywords),
+            self.INTERVIEW_PREPARATION: self._compile_keywords(self.interview_keywords),
+            self.GENERAL_EDUCATION: self._compile_keywords(self.education_keywords),
+        }
+
+    @staticmethod
+    def _compile_keywords(keywords: list):
         """
-        Count how many keywords match in the text.
-        
+        Compile each keyword into its own search pattern.
+
         Args:
-            text: Input text to analyze
             keywords: List of keywords to match
-            
+
         Returns:
-            Number of keyword matches
+            List of compiled regexes, one per keyword
         """
-        text_lower = text.lower()
-        count = 0
-        
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                count += 1
-        
-        return count
+        return [re.compile(re.escape(keyword.lower())) for keyword in keywords]
+
+    def _count_keyword_matches(self, text: str, intent: str) -> int:
+        """
+        Count how many category keywords appear in the text.
+
+        Args:
+            text: Lowercased input text to analyze
+            intent: Intent category whose keywords to match
+
+        Returns:
+            Number of keywords present in the text
+        """
+        return sum(
+            1 for pattern in self._compiled_keywords[intent] if pattern.search(text)
+        )
     
     def classify_intent(self, query: str) -> str:
         """
@@ -76,12 +96,13 @@ class IntentRouter:
         """
         if not query:
             return self.GENERAL_EDUCATION
-        
-        # Count matches for each category
-        internship_score = self._count_keyword_matches(query, self.internship_keywords)
-        coding_score = self._count_keyword_matches(query, self.coding_keywords)
-        interview_score = self._count_keyword_matches(query, self.interview_keywords)
-        education_score = self._count_keyword_matches(query, self.education_keywords)
+
+        # Count matches for each category (lowercase once, scan compiled)
+        query_lower = query.lower()
+        internship_score = self._count_keyword_matches(query_lower, self.COMPANY_INTERNSHIP)
+        coding_score = self._count_keyword_matches(query_lower, self.EDUCATION_CODING)
+        interview_score = self._count_keyword_matches(query_lower, self.INTERVIEW_PREPARATION)
+        education_score = self._count_keyword_matches(query_lower, self.GENERAL_EDUCATION)
         
         # Determine intent based on highest score
         scores = {
@@ -7,8 +7,82 @@ Author: Prashiskshan Backend Team
 """
 
 import os
-import json
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+__all__ = [
+    "SimpleResumeEnhancer",
+    "enhance_resume_simple",
+    "apply_enhancements_to_text",
+]
+
+# pyahocorasick is a C extension; load it lazily on first use so
+# importing this module stays cheap for the Flask worker
+_ahocorasick = None
+_ahocorasick_checked = False
+
+
+def _get_ahocorasick():
+    """Return the ahocorasick module, or None if not installed."""
+    global _ahocorasick, _ahocorasick_checked
+    if not _ahocorasick_checked:
+        _ahocorasick_checked = True
+        try:
+            import ahocorasick
+            _ahocorasick = ahocorasick
+        except ImportError:
+            _ahocorasick = None
+    return _ahocorasick
+
+
+def apply_enhancements_to_text(text: str, enhancement_list: List[Dict[str, str]]) -> str:
+    """
+    Apply all original -> enhanced replacements to the text.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is available
+    (O(len(text) + matches) instead of one full scan-and-copy per
+    enhancement), falling back to sequential str.replace otherwise.
+    Overlapping matches are resolved greedily, leftmost first.
+
+    Args:
+        text: Resume text to enhance
+        enhancement_list: List of dicts with 'original' and 'enhanced'
+
+    Returns:
+        Text with all enhancements applied
+    """
+    replacements = [
+        (enh.get('original', ''), enh.get('enhanced', ''))
+        for enh in enhancement_list
+        if enh.get('original', '') and enh.get('enhanced', '')
+    ]
+    if not replacements:
+        return text
+
+    ahocorasick = _get_ahocorasick()
+    if ahocorasick is None:
+        # Fallback: one scan per enhancement
+        for original, enhanced in replacements:
+            text = text.replace(original, enhanced)
+        return text
+
+    automaton = ahocorasick.Automaton()
+    for original, enhanced in replacements:
+        automaton.add_word(original, (len(original), enhanced))
+    automaton.make_automaton()
+
+    # Collect non-overlapping matches, preferring the leftmost match
+    parts = []
+    prev_end = 0
+    for end_index, (length, enhanced) in automaton.iter(text):
+        start = end_index - length + 1
+        if start < prev_end:
+            continue  # Overlaps an already-applied replacement
+        parts.append(text[prev_end:start])
+        parts.append(enhanced)
+        prev_end = end_index + 1
+
+    parts.append(text[prev_end:])
+    return "".join(parts)
 
 
 class SimpleResumeEnhancer:
@@ -74,13 +148,8 @@ class SimpleResumeEnhancer:
             enhancements = result['enhancements']
             enhancement_list = enhancements.get('enhancements', [])
             
-            # Step 2: Create enhanced text by applying changes
-            enhanced_text = resume_text
-            for enh in enhancement_list:
-                original = enh.get('original', '')
-                enhanced = enh.get('enhanced', '')
-                if original and enhanced:
-                    enhanced_text = enhanced_text.replace(original, enhanced)
+            # Step 2: Create enhanced text by applying changes in one pass
+            enhanced_text = apply_enhancements_to_text(resume_text, enhancement_list)
             
             # Step 3-5: Save files only if requested
             enhanced_text_path = None
@@ -88,40 +157,52 @@ class SimpleResumeEnhancer:
             comparison_path = None
             
             if save_files:
-                # Save enhanced text
                 enhanced_text_path = os.path.join(output_dir, f"{base_name}_Enhanced.txt")
-                with open(enhanced_text_path, 'w', encoding='utf-8') as f:
-                    f.write(enhanced_text)
-                print(f"✓ Enhanced text saved: {enhanced_text_path}")
-                
-                # Save original text
                 original_text_path = os.path.join(output_dir, f"{base_name}_Original.txt")
-                with open(original_text_path, 'w', encoding='utf-8') as f:
-                    f.write(resume_text)
-                print(f"✓ Original text saved: {original_text_path}")
-                
-                # Create comparison file
                 comparison_path = os.path.join(output_dir, f"{base_name}_Comparison.txt")
-                with open(comparison_path, 'w', encoding='utf-8') as f:
-                    f.write("="*80 + "\n")
-                    f.write("RESUME ENHANCEMENTS\n")
-                    f.write("="*80 + "\n\n")
-                    
-                    for i, enh in enumerate(enhancement_list, 1):
-                        f.write(f"\n{i}. {enh.get('reason', 'Enhancement')}\n")
-                        f.write(f"   ORIGINAL: {enh.get('original', '')}\n")
-                        f.write(f"   ENHANCED: {enh.get('enhanced', '')}\n")
-                    
-                    f.write("\n\n" + "="*80 + "\n")
-                    f.write("ORIGINAL RESUME\n")
-                    f.write("="*80 + "\n\n")
-                    f.write(resume_text)
-                    
-                    f.write("\n\n" + "="*80 + "\n")
-                    f.write("ENHANCED RESUME\n")
-                    f.write("="*80 + "\n\n")
-                    f.write(enhanced_text)
-                
+
+                # Build the comparison content in memory, then write once
+                comparison_parts = [
+                    "=" * 80 + "\n",
+                    "RESUME ENHANCEMENTS\n",
+                    "=" * 80 + "\n\n",
+                ]
+
+                for i, enh in enumerate(enhancement_list, 1):
+                    comparison_parts.append(f"\n{i}. {enh.get('reason', 'Enhancement')}\n")
+                    comparison_parts.append(f"   ORIGINAL: {enh.get('original', '')}\n")
+                    comparison_parts.append(f"   ENHANCED: {enh.get('enhanced', '')}\n")
+
+                comparison_parts.extend([
+                    "\n\n" + "=" * 80 + "\n",
+                    "ORIGINAL RESUME\n",
+                    "=" * 80 + "\n\n",
+                    resume_text,
+                    "\n\n" + "=" * 80 + "\n",
+                    "ENHANCED RESUME\n",
+                    "=" * 80 + "\n\n",
+                    enhanced_text,
+                ])
+
+                from concurrent.futures import ThreadPoolExecutor
+
+                def write_file(path, content):
+                    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                        f.write(content)
+
+                # The three outputs are independent and I/O bound, so
+                # write them in parallel
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    writes = [
+                        executor.submit(write_file, enhanced_text_path, enhanced_text),
+                        executor.submit(write_file, original_text_path, resume_text),
+                        executor.submit(write_file, comparison_path, "".join(comparison_parts)),
+                    ]
+                    for write in writes:
+                        write.result()
+
+                print(f"✓ Enhanced text saved: {enhanced_text_path}")
+                print(f"✓ Original text saved: {original_text_path}")
                 print(f"✓ Comparison file saved: {comparison_path}")
             
             # Step 6: Try to create enhanced PDF (only if saving files)